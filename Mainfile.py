@@ -1,30 +1,80 @@
 # app.py
 # Main Flask application for the MOSIP Notification System
 
-from flask import Flask, request, jsonify
-from dotenv import load_dotenv
+from flask import Flask, request
+import msgspec
+import orjson
+import asyncio
+import atexit
+import functools
+import logging
+import logging.handlers
 import os
-from datetime import datetime
+import queue
+import threading
+import uuid
+from datetime import date
+from typing import Optional, Union
+
+from config import get_config, load_env
 
 # Load environment variables from .env file
-load_dotenv()
+load_env()
 
-# Import configuration and core components
-from config import Config
-from notification_core import NotificationRequest, NotificationChannel, NotificationService
+def configure_logging(level: int = logging.INFO):
+    """
+    Routes all log records through a queue to a background listener thread,
+    so request handlers never block on log I/O.
+    :param level: The root log level.
+    """
+    log_queue = queue.SimpleQueue()
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+    listener = logging.handlers.QueueListener(log_queue, handler, respect_handler_level=True)
+
+    root = logging.getLogger()
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    root.setLevel(level)
+    listener.start()
+    atexit.register(listener.stop)
+
+configure_logging()
+
+# Import core components
+from notification_core import NotificationRequest, NotificationChannel, NotificationService, RECIPIENT_ATTR
+from notification_batcher import NotificationBatcher
 from senders.whatsapp_sender import WhatsAppSender
 from senders.telegram_sender import TelegramSender
 from senders.viber_sender import ViberSender
 
+config = get_config()
+
 app = Flask(__name__)
-app.config.from_object(Config)
+app.config.from_object(config)
+
+# Background event loop that runs all outbound HTTP calls.
+# Flask handlers stay synchronous and hand coroutines to this loop,
+# so the channels of a single request are dispatched concurrently.
+event_loop = asyncio.new_event_loop()
+threading.Thread(target=event_loop.run_forever, name="notification-loop", daemon=True).start()
+
+def run_async(coro):
+    """
+    Runs a coroutine on the background event loop and blocks until it completes.
+    :param coro: The coroutine to run.
+    :return: The coroutine's result.
+    """
+    return asyncio.run_coroutine_threadsafe(coro, event_loop).result()
+
+async def _create_senders():
+    # Each sender opens its own pooled HTTP session, which must be
+    # created on the loop that will use it.
+    return WhatsAppSender(config), TelegramSender(config), ViberSender(config)
 
 # Initialize sender services
 # In a real application, you might use a dependency injection container
 # to manage these, but for a simple Flask app, direct instantiation is fine.
-whatsapp_sender = WhatsAppSender(app.config)
-telegram_sender = TelegramSender(app.config)
-viber_sender = ViberSender(app.config)
+whatsapp_sender, telegram_sender, viber_sender = run_async(_create_senders())
 
 # Map channel types to sender instances
 notification_senders = {
@@ -32,138 +82,368 @@ notification_senders = {
     NotificationChannel.TELEGRAM: telegram_sender,
     NotificationChannel.VIBER: viber_sender,
     # Add Email and SMS senders if you implement them in Python
-    # NotificationChannel.EMAIL: EmailSender(app.config),
-    # NotificationChannel.SMS: SMSSender(app.config),
+    # NotificationChannel.EMAIL: EmailSender(config),
+    # NotificationChannel.SMS: SMSSender(config),
 }
 
 # Initialize the NotificationService with all available senders
 notification_service = NotificationService(notification_senders)
 
+# Single and batch requests both go through the batcher, so concurrent
+# requests are coalesced. Outbound concurrency is bounded per provider by the senders.
+notification_batcher = NotificationBatcher(notification_service)
+
+# Seconds to wait at shutdown for accepted notifications to finish sending,
+# kept below Gunicorn's default 30-second graceful_timeout
+SHUTDOWN_DRAIN_TIMEOUT = 20
+
+async def _close_senders():
+    for sender in notification_senders.values():
+        await sender.close()
+
+def _shutdown():
+    # Let accepted (202) notifications finish before their sessions are closed
+    dropped = notification_batcher.drain(SHUTDOWN_DRAIN_TIMEOUT)
+    if dropped:
+        app.logger.error("Dropped %s accepted notifications still pending at shutdown", dropped)
+    run_async(_close_senders())
+
+atexit.register(_shutdown)
+
+# Most alerts a single batch call may carry. Kept well below the batcher's
+# max_pending, so a batch rejected with 503 can succeed once the queue drains.
+MAX_BATCH_ALERTS = 1_000
+
+# Channel names accepted in payloads, in upper and lower case, so the common
+# spellings resolve with a single dict lookup
+_CHANNEL_BY_NAME = {channel.name: channel for channel in NotificationChannel}
+_CHANNEL_BY_NAME.update({channel.name.lower(): channel for channel in NotificationChannel})
+
+def json_response(obj, status: int):
+    """
+    Builds a JSON response, encoded with orjson instead of Flask's stdlib-based jsonify.
+    :param obj: The JSON-serializable response body.
+    :param status: The HTTP status code.
+    :return: The Flask response object.
+    """
+    return app.response_class(orjson.dumps(obj), status=status, mimetype="application/json")
+
+def _log_dispatch_result(notification_id: str, future):
+    if future.cancelled():
+        app.logger.warning("Notification %s was cancelled", notification_id)
+    elif future.exception() is not None:
+        app.logger.error("Error dispatching notification %s: %s", notification_id, future.exception())
+    elif not future.result():
+        app.logger.warning("Failed to dispatch notification %s", notification_id)
+
+def queue_notifications(notification_requests: list) -> Optional[list]:
+    """
+    Hands notification requests to the background batcher without waiting for delivery.
+    :param notification_requests: The NotificationRequest objects.
+    :return: An ID per queued request, or None if the queue is full.
+    """
+    futures = notification_batcher.submit(notification_requests, event_loop)
+    if futures is None:
+        return None
+
+    notification_ids = []
+    for future in futures:
+        notification_id = uuid.uuid4().hex
+        future.add_done_callback(functools.partial(_log_dispatch_result, notification_id))
+        notification_ids.append(notification_id)
+    return notification_ids
+
+class ExpiryAlert(msgspec.Struct, rename="camel"):
+    """
+    JSON payload of an expiry alert. msgspec decodes and type-checks it in a single pass;
+    field names map to their camelCase JSON keys (e.g. recipientPhoneNumber).
+    """
+    recipient_email: Optional[str] = None
+    recipient_phone_number: Optional[str] = None
+    telegram_chat_id: Union[str, int, None] = None
+    viber_user_id: Optional[str] = None
+    message_subject: Optional[str] = None
+    message_body: Optional[str] = None
+    expiry_type: str = "Certificate" # Same defaults as NotificationRequest
+    expiry_date: Optional[date] = None # YYYY-MM-DD
+    action_steps: str = "Please renew your credential."
+    channels: list[str] = []
+    locale: str = "en" # Default to English if not provided
+
+_alert_decoder = msgspec.json.Decoder(ExpiryAlert)
+_alert_batch_decoder = msgspec.json.Decoder(list[ExpiryAlert])
+
+def to_notification_request(alert: ExpiryAlert) -> NotificationRequest:
+    """
+    Builds a NotificationRequest from a decoded alert payload, rejecting alerts that
+    could never be delivered so the client hears about it before anything is queued.
+    :param alert: The decoded ExpiryAlert.
+    :return: The NotificationRequest object.
+    :raises ValueError: If the payload names no channels, an unknown or unsupported
+                        channel, or a channel whose recipient field is missing.
+    """
+    # An alert without channels (including an empty {} payload) can never be sent
+    if not alert.channels:
+        raise ValueError("No notification channels specified.")
+
+    # Convert channel strings to NotificationChannel enum members
+    channels = []
+    for channel_name in alert.channels:
+        channel = _CHANNEL_BY_NAME.get(channel_name)
+        if channel is None:
+            channel = _CHANNEL_BY_NAME.get(channel_name.upper())
+        if channel is None:
+            raise ValueError(f"Invalid channel: {channel_name}")
+        if channel not in notification_senders:
+            raise ValueError(f"Unsupported channel: {channel_name}")
+        channels.append(channel)
+
+    # Create NotificationRequest object
+    notification_request = NotificationRequest(
+        recipient_email=alert.recipient_email,
+        recipient_phone_number=alert.recipient_phone_number,
+        telegram_chat_id=alert.telegram_chat_id,
+        viber_user_id=alert.viber_user_id,
+        message_subject=alert.message_subject,
+        message_body=alert.message_body,
+        expiry_type=alert.expiry_type,
+        expiry_date=alert.expiry_date,
+        action_steps=alert.action_steps,
+        channels=channels,
+        locale=alert.locale
+    )
+
+    # Every requested channel needs its recipient
+    for channel in channels:
+        if not getattr(notification_request, RECIPIENT_ATTR[channel]):
+            raise ValueError(f"Missing recipient for channel {channel.name}")
+    return notification_request
+
 @app.route('/notification/sendExpiryAlert', methods=['POST'])
 def send_expiry_alert():
     """
     API endpoint to send certificate/event expiry alerts.
     Expects a JSON payload with notification details.
+    The alert is validated and queued, then sent in the background. Responds 202
+    with its ID, 400 if it could never be delivered, or 503 if the queue is full.
     """
-    data = request.get_json()
+    try:
+        try:
+            notification_request = to_notification_request(_alert_decoder.decode(request.get_data()))
+        except msgspec.ValidationError as e:
+            return json_response({"status": "error", "message": str(e)}, 400)
+        except msgspec.DecodeError:
+            return json_response({"status": "error", "message": "Invalid JSON payload"}, 400)
+        except ValueError as e:
+            return json_response({"status": "error", "message": str(e)}, 400)
 
-    if not data:
-        return jsonify({"status": "error", "message": "Invalid JSON payload"}), 400
+        # Queue the notification
+        notification_ids = queue_notifications([notification_request])
 
-    try:
-        # Parse expiryDate string to datetime object
-        expiry_date_str = data.get('expiryDate')
-        expiry_date = None
-        if expiry_date_str:
-            try:
-                expiry_date = datetime.strptime(expiry_date_str, '%Y-%m-%d').date()
-            except ValueError:
-                return jsonify({"status": "error", "message": "Invalid expiryDate format. Use YYYY-MM-DD."}), 400
+        if notification_ids is None:
+            return json_response({"status": "error", "message": "Notification queue is full. Retry later."}, 503)
+        return json_response({"status": "queued", "id": notification_ids[0]}, 202)
 
-        # Convert channel strings to NotificationChannel enum members
-        channels_str = data.get('channels', [])
-        channels = []
-        for channel_name in channels_str:
+    except Exception as e:
+        app.logger.error("Error processing notification request: %s", e, exc_info=True)
+        return json_response({"status": "error", "message": f"Internal server error: {str(e)}"}, 500)
+
+@app.route('/notification/sendExpiryAlertBatch', methods=['POST'])
+def send_expiry_alert_batch():
+    """
+    API endpoint to send many expiry alerts in one call.
+    Expects a JSON array of payloads in the same format as /notification/sendExpiryAlert.
+    The alerts are queued and sent in the background; responds 202 with their IDs
+    in order, 413 if there are more than MAX_BATCH_ALERTS, or 503 (queuing none
+    of them) if the queue cannot take them all.
+    """
+    try:
+        try:
+            alerts = _alert_batch_decoder.decode(request.get_data())
+        except msgspec.ValidationError as e:
+            return json_response({"status": "error", "message": str(e)}, 400)
+        except msgspec.DecodeError:
+            alerts = None
+        if not alerts:
+            return json_response({"status": "error", "message": "Invalid JSON payload. Expected a non-empty array."}, 400)
+        if len(alerts) > MAX_BATCH_ALERTS:
+            return json_response({"status": "error", "message": f"Too many alerts. Send at most {MAX_BATCH_ALERTS} per batch."}, 413)
+
+        notification_requests = []
+        for index, alert in enumerate(alerts):
             try:
-                channels.append(NotificationChannel[channel_name.upper()])
-            except KeyError:
-                return jsonify({"status": "error", "message": f"Invalid channel: {channel_name}"}), 400
-
-        # Create NotificationRequest object
-        notification_request = NotificationRequest(
-            recipient_email=data.get('recipientEmail'),
-            recipient_phone_number=data.get('recipientPhoneNumber'),
-            telegram_chat_id=data.get('telegramChatId'),
-            viber_user_id=data.get('viberUserId'),
-            message_subject=data.get('messageSubject'),
-            message_body=data.get('messageBody'),
-            expiry_type=data.get('expiryType'),
-            expiry_date=expiry_date,
-            action_steps=data.get('actionSteps'),
-            channels=channels,
-            locale=data.get('locale', 'en') # Default to English if not provided
-        )
+                notification_requests.append(to_notification_request(alert))
+            except ValueError as e:
+                return json_response({"status": "error", "message": f"Alert {index}: {e}"}, 400)
 
-        # Send the notification
-        success = notification_service.send_notification(notification_request)
+        # Queue the notifications
+        notification_ids = queue_notifications(notification_requests)
 
-        if success:
-            return jsonify({"status": "success", "message": "Notification dispatch initiated."}), 200
-        else:
-            return jsonify({"status": "error", "message": "Failed to dispatch all notifications."}), 500
+        if notification_ids is None:
+            return json_response({"status": "error", "message": "Notification queue is full. Retry later."}, 503)
+        return json_response({"status": "queued", "ids": notification_ids}, 202)
 
     except Exception as e:
-        app.logger.error(f"Error processing notification request: {e}", exc_info=True)
-        return jsonify({"status": "error", "message": f"Internal server error: {str(e)}"}), 500
+        app.logger.error("Error processing notification batch: %s", e, exc_info=True)
+        return json_response({"status": "error", "message": f"Internal server error: {str(e)}"}, 500)
 
 if __name__ == '__main__':
-    # Run the Flask app
-    # In a production environment, use a WSGI server like Gunicorn or uWSGI
-    app.run(debug=True, host='0.0.0.0', port=5000)
+    # Run the Flask development server
+    # In a production environment, run under Gunicorn instead: gunicorn -c gunicorn_conf.py
+    app.run(host='0.0.0.0', port=5000)
+
+```python
+# gunicorn_conf.py
+# Production server settings. Run with: gunicorn -c gunicorn_conf.py
+
+import multiprocessing
+
+wsgi_app = "app:app"
+bind = "0.0.0.0:5000"
+
+# Threaded workers, so handlers waiting on I/O overlap within each process
+workers = multiprocessing.cpu_count() * 2 + 1
+worker_class = "gthread"
+threads = 16
+
+# Keep client connections open between requests
+keepalive = 30
+
+# Each worker imports the app itself: its background event loop thread
+# and the senders' HTTP sessions do not survive a fork
+preload_app = False
 
 ```python
 # config.py
 # Centralized configuration for the Flask application
 
+import logging
 import os
+from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Mapping, Optional
+
+from dotenv import dotenv_values
 
+log = logging.getLogger(__name__)
+
+@lru_cache(maxsize=1)
+def load_env(path: Optional[str] = None) -> Mapping[str, str]:
+    """
+    Parses the .env file once and copies its values into os.environ, without
+    overriding variables that are already set. Later calls (e.g. on reload or in
+    tests) return the cached values instead of re-parsing the file.
+    :param path: Path to the .env file; searched for from this directory if omitted.
+    :return: Read-only mapping of the values parsed from the file.
+    """
+    values = {key: value for key, value in dotenv_values(path).items() if value is not None}
+    for key, value in values.items():
+        os.environ.setdefault(key, value)
+    return MappingProxyType(values)
+
+@dataclass(frozen=True, slots=True)
 class Config:
     """
-    Configuration class to load API keys and other settings from environment variables.
+    Immutable snapshot of the API keys and other settings read from environment variables.
+    Use get_config() to obtain the shared instance.
     """
     # WhatsApp API Configuration
-    WHATSAPP_API_URL = os.getenv('WHATSAPP_API_URL', '[https://graph.facebook.com/v19.0](https://graph.facebook.com/v19.0)')
-    WHATSAPP_ACCESS_TOKEN = os.getenv('WHATSAPP_ACCESS_TOKEN')
-    WHATSAPP_FROM_PHONE_NUMBER_ID = os.getenv('WHATSAPP_FROM_PHONE_NUMBER_ID')
-    WHATSAPP_TEMPLATE_NAME = os.getenv('WHATSAPP_TEMPLATE_NAME', 'expiry_alert_template') # Pre-approved template
+    WHATSAPP_API_URL: str
+    WHATSAPP_ACCESS_TOKEN: Optional[str]
+    WHATSAPP_FROM_PHONE_NUMBER_ID: Optional[str]
+    WHATSAPP_TEMPLATE_NAME: str # Pre-approved template
 
     # Telegram API Configuration
-    TELEGRAM_API_URL = os.getenv('TELEGRAM_API_URL', '[https://api.telegram.org/bot](https://api.telegram.org/bot)')
-    TELEGRAM_BOT_TOKEN = os.getenv('TELEGRAM_BOT_TOKEN')
+    TELEGRAM_API_URL: str
+    TELEGRAM_BOT_TOKEN: Optional[str]
 
     # Viber API Configuration
-    VIBER_API_URL = os.getenv('VIBER_API_URL', '[https://chatapi.viber.com/pa/](https://chatapi.viber.com/pa/)')
-    VIBER_AUTH_TOKEN = os.getenv('VIBER_AUTH_TOKEN')
-    VIBER_SENDER_NAME = os.getenv('VIBER_SENDER_NAME', 'MOSIP Alerts')
-    VIBER_SENDER_AVATAR = os.getenv('VIBER_SENDER_AVATAR', '') # Optional
+    VIBER_API_URL: str
+    VIBER_AUTH_TOKEN: Optional[str]
+    VIBER_SENDER_NAME: str
+    VIBER_SENDER_AVATAR: str # Optional
+
+def calculate_config() -> Config:
+    """
+    Reads all settings from the environment. Has no side effects.
+    :return: A new Config snapshot.
+    """
+    return Config(
+        WHATSAPP_API_URL=os.getenv('WHATSAPP_API_URL', '[https://graph.facebook.com/v19.0](https://graph.facebook.com/v19.0)'),
+        WHATSAPP_ACCESS_TOKEN=os.getenv('WHATSAPP_ACCESS_TOKEN'),
+        WHATSAPP_FROM_PHONE_NUMBER_ID=os.getenv('WHATSAPP_FROM_PHONE_NUMBER_ID'),
+        WHATSAPP_TEMPLATE_NAME=os.getenv('WHATSAPP_TEMPLATE_NAME', 'expiry_alert_template'),
+        TELEGRAM_API_URL=os.getenv('TELEGRAM_API_URL', '[https://api.telegram.org/bot](https://api.telegram.org/bot)'),
+        TELEGRAM_BOT_TOKEN=os.getenv('TELEGRAM_BOT_TOKEN'),
+        VIBER_API_URL=os.getenv('VIBER_API_URL', '[https://chatapi.viber.com/pa/](https://chatapi.viber.com/pa/)'),
+        VIBER_AUTH_TOKEN=os.getenv('VIBER_AUTH_TOKEN'),
+        VIBER_SENDER_NAME=os.getenv('VIBER_SENDER_NAME', 'MOSIP Alerts'),
+        VIBER_SENDER_AVATAR=os.getenv('VIBER_SENDER_AVATAR', ''),
+    )
+
+@lru_cache(maxsize=1)
+def get_config() -> Config:
+    """
+    Returns the process-wide Config, reading the environment only on the first call.
+    Call get_config.cache_clear() to force a re-read (e.g. in tests).
+    :return: The shared Config snapshot.
+    """
+    config = calculate_config()
 
     # Ensure essential tokens are provided
-    if not WHATSAPP_ACCESS_TOKEN:
-        print("WARNING: WHATSAPP_ACCESS_TOKEN not set in .env")
-    if not TELEGRAM_BOT_TOKEN:
-        print("WARNING: TELEGRAM_BOT_TOKEN not set in .env")
-    if not VIBER_AUTH_TOKEN:
-        print("WARNING: VIBER_AUTH_TOKEN not set in .env")
+    if not config.WHATSAPP_ACCESS_TOKEN:
+        log.warning("WHATSAPP_ACCESS_TOKEN not set in .env")
+    if not config.TELEGRAM_BOT_TOKEN:
+        log.warning("TELEGRAM_BOT_TOKEN not set in .env")
+    if not config.VIBER_AUTH_TOKEN:
+        log.warning("VIBER_AUTH_TOKEN not set in .env")
+    return config
 
 ```python
 # notification_core.py
-# Core interfaces (Abstract Base Classes) and Data Transfer Objects (DTOs)
+# Core interfaces (Protocols) and Data Transfer Objects (DTOs)
 
-from abc import ABC, abstractmethod
-from enum import Enum
+import asyncio
+import logging
+import operator
+from enum import IntEnum
 from dataclasses import dataclass
 from datetime import date
-from typing import List, Optional
+from typing import Callable, List, Optional, Protocol, Union
 
-class NotificationChannel(Enum):
+log = logging.getLogger(__name__)
+
+class NotificationChannel(IntEnum):
     """
     Enum representing the different notification channels supported.
+    Values are dense indexes from 0, so per-channel tables can be plain lists.
     """
-    EMAIL = "EMAIL"
-    SMS = "SMS"
-    WHATSAPP = "WHATSAPP"
-    TELEGRAM = "TELEGRAM"
-    VIBER = "VIBER"
+    EMAIL = 0
+    SMS = 1
+    WHATSAPP = 2
+    TELEGRAM = 3
+    VIBER = 4
+
+# NotificationRequest field holding the recipient for each channel
+RECIPIENT_ATTR = {
+    NotificationChannel.EMAIL: "recipient_email",
+    NotificationChannel.SMS: "recipient_phone_number",
+    NotificationChannel.WHATSAPP: "recipient_phone_number",
+    NotificationChannel.TELEGRAM: "telegram_chat_id",
+    NotificationChannel.VIBER: "viber_user_id",
+}
 
-@dataclass
+@dataclass(slots=True, kw_only=True)
 class NotificationRequest:
     """
     Data Transfer Object (DTO) for a notification request.
     Contains all details needed to send an alert across various channels.
+    Slotted to keep per-request instances small; fields must be passed by keyword.
     """
     recipient_email: Optional[str] = None
     recipient_phone_number: Optional[str] = None # Used for SMS and WhatsApp
-    telegram_chat_id: Optional[str] = None
+    telegram_chat_id: Union[str, int, None] = None
     viber_user_id: Optional[str] = None
 
     message_subject: Optional[str] = None # Primarily for Email
@@ -176,27 +456,32 @@ class NotificationRequest:
     channels: List[NotificationChannel] # List of channels to send to
     locale: str = "en" # Locale for multilingual messages (e.g., "en", "fr")
 
-class NotificationSender(ABC):
+class NotificationSender(Protocol):
     """
-    Abstract Base Class (Interface) for all notification senders.
-    Defines the contract for sending notifications to a specific channel.
+    Structural interface for all notification senders.
+    Defines the contract for sending notifications to a specific channel;
+    senders satisfy it by implementing these methods, without inheriting from it.
     """
-    @abstractmethod
-    def send(self, request: NotificationRequest) -> bool:
+    async def send(self, request: NotificationRequest) -> bool:
         """
         Sends a notification based on the provided request.
         :param request: The NotificationRequest object.
         :return: True if the notification was successfully sent, False otherwise.
         """
-        pass
+        ...
 
-    @abstractmethod
     def get_channel_type(self) -> NotificationChannel:
         """
         Returns the type of notification channel this sender handles.
         :return: The NotificationChannel enum member.
         """
-        pass
+        ...
+
+    async def close(self) -> None:
+        """
+        Releases the sender's pooled HTTP connections.
+        """
+        ...
 
 class NotificationService:
     """
@@ -205,49 +490,347 @@ class NotificationService:
     """
     def __init__(self, senders: dict[NotificationChannel, NotificationSender]):
         self.senders = senders
-        print(f"Initialized notification senders: {list(self.senders.keys())}")
-
-    def send_notification(self, request: NotificationRequest) -> bool:
+        # Sender and recipient-field getter per channel, indexed by channel value
+        # so dispatch needs a single list load per requested channel
+        self._dispatch: list[Optional[tuple[NotificationSender, Callable]]] = [None] * len(NotificationChannel)
+        for channel, sender in senders.items():
+            self._dispatch[channel] = (sender, operator.attrgetter(RECIPIENT_ATTR[channel]))
+        # Sends currently in progress, so identical concurrent notifications share one API call
+        self._in_flight: dict[tuple, asyncio.Future] = {}
+        log.info("Initialized notification senders: %s", list(self.senders.keys()))
+
+    async def send_notification(self, request: NotificationRequest) -> bool:
         """
-        Dispatches the notification request to the specified channels.
+        Dispatches the notification request to the specified channels concurrently.
         :param request: The NotificationRequest object.
         :return: True if at least one notification was successfully sent, False otherwise.
         """
-        overall_success = False
         if not request.channels:
-            print("No notification channels specified in the request.")
+            log.warning("No notification channels specified in the request.")
             return False
 
+        channels = []
+        sends = []
         for channel in request.channels:
-            sender = self.senders.get(channel)
-            if sender:
-                print(f"Attempting to send notification via {channel.value}")
-                try:
-                    sent = sender.send(request)
-                    if sent:
-                        overall_success = True
-                        print(f"Successfully sent notification via {channel.value}")
-                    else:
-                        print(f"Failed to send notification via {channel.value}")
-                except Exception as e:
-                    print(f"Error sending notification via {channel.value}: {e}")
+            entry = self._dispatch[channel]
+            if entry is None:
+                log.warning("No sender found for channel: %s", channel.name)
+                continue
+            sender, get_recipient = entry
+            recipient = get_recipient(request)
+            if not recipient:
+                log.warning("No recipient for channel %s in the request.", channel.name)
+                continue
+            log.debug("Attempting to send notification via %s", channel.name)
+            channels.append(channel)
+            sends.append(self._send_once(channel, sender, recipient, request))
+
+        if len(sends) == 1:
+            # Most alerts target a single channel: await its send directly
+            # instead of paying for gather's task and future bookkeeping
+            try:
+                results = [await sends[0]]
+            except Exception as e:
+                results = [e]
+        else:
+            results = await asyncio.gather(*sends, return_exceptions=True)
+
+        overall_success = False
+        for channel, sent in zip(channels, results):
+            if isinstance(sent, Exception):
+                log.error("Error sending notification via %s: %s", channel.name, sent)
+            elif sent:
+                overall_success = True
+                log.info("Successfully sent notification via %s", channel.name)
             else:
-                print(f"No sender found for channel: {channel.value}")
+                log.warning("Failed to send notification via %s", channel.name)
         return overall_success
 
+    async def _send_once(self, channel: NotificationChannel, sender: NotificationSender,
+                         recipient: str, request: NotificationRequest) -> bool:
+        # Joins an identical send that is already in progress instead of calling the API again
+        key = (
+            channel,
+            recipient,
+            request.expiry_type,
+            request.expiry_date,
+            request.action_steps,
+            request.locale,
+        )
+        in_flight = self._in_flight.get(key)
+        if in_flight is None:
+            in_flight = asyncio.ensure_future(sender.send(request))
+            self._in_flight[key] = in_flight
+            in_flight.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        # Shielded so one caller being cancelled does not cancel the send for the others
+        return await asyncio.shield(in_flight)
+
+```python
+# notification_batcher.py
+# Coalesces notification requests into batches dispatched with bounded concurrency
+
+import asyncio
+import concurrent.futures
+import threading
+from typing import List, Optional
+
+from notification_core import NotificationRequest, NotificationService
+
+class NotificationBatcher:
+    """
+    Collects notification requests for up to max_queue_time seconds, or until
+    max_batch_size requests are waiting, and dispatches each batch concurrently
+    through the NotificationService. Outbound concurrency is bounded per provider
+    by the senders (see senders.transport.CHANNEL_CONCURRENCY), not here, so a
+    slow channel never holds up the others.
+    Apart from submit(), all methods must be called on the same event loop.
+    """
+    def __init__(self, service: NotificationService, max_batch_size: int = 100,
+                 max_queue_time: float = 0.05, max_pending: int = 10_000):
+        self.service = service
+        self.max_batch_size = max_batch_size
+        self.max_queue_time = max_queue_time
+        self.max_pending = max_pending
+
+        # Requests handed over by submit() that have not finished yet
+        self._pending = 0
+        self._submitted: set[concurrent.futures.Future] = set()
+        self._pending_lock = threading.Lock()
+
+        # Created lazily so they bind to the loop the batcher runs on
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._batches: set[asyncio.Task] = set()
+
+    async def process(self, request: NotificationRequest) -> bool:
+        """
+        Queues a request for the next batch and waits for it to be dispatched.
+        :param request: The NotificationRequest object.
+        :return: True if at least one notification was successfully sent, False otherwise.
+        """
+        if self._worker is None:
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.create_task(self._collect_batches())
+
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((request, future))
+        return await future
+
+    def submit(self, requests: List[NotificationRequest],
+               loop: asyncio.AbstractEventLoop) -> Optional[List[concurrent.futures.Future]]:
+        """
+        Hands requests to the batcher running on the given loop without waiting for them.
+        Safe to call from any thread. The requests are accepted all together, or not at
+        all if that would take the number of unfinished requests above max_pending.
+        :param requests: The NotificationRequest objects.
+        :param loop: The event loop the batcher runs on.
+        :return: A future per request resolving to its result, or None if the batcher is full.
+        """
+        with self._pending_lock:
+            if self._pending + len(requests) > self.max_pending:
+                return None
+            self._pending += len(requests)
+
+        futures = []
+        for request in requests:
+            future = asyncio.run_coroutine_threadsafe(self.process(request), loop)
+            with self._pending_lock:
+                self._submitted.add(future)
+            future.add_done_callback(self._release)
+            futures.append(future)
+        return futures
+
+    def drain(self, timeout: float) -> int:
+        """
+        Waits for the requests handed over by submit() to finish, e.g. at shutdown.
+        Requests still unfinished after the timeout are cancelled.
+        Must not be called on the batcher's event loop.
+        :param timeout: Maximum number of seconds to wait.
+        :return: The number of requests that were cancelled.
+        """
+        with self._pending_lock:
+            submitted = list(self._submitted)
+        _, not_done = concurrent.futures.wait(submitted, timeout=timeout)
+        for future in not_done:
+            future.cancel()
+        return len(not_done)
+
+    async def process_batch(self, batch: List[tuple[NotificationRequest, asyncio.Future]]):
+        """
+        Dispatches a batch concurrently, resolving each request's future as soon as
+        its own send finishes rather than when the whole batch does.
+        :param batch: (NotificationRequest, future) pairs to send.
+        """
+        await asyncio.gather(*(self._dispatch(request, future) for request, future in batch))
+
+    def _release(self, future: concurrent.futures.Future):
+        with self._pending_lock:
+            self._pending -= 1
+            self._submitted.discard(future)
+
+    async def _collect_batches(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_queue_time
+            while len(batch) < self.max_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            # Dispatch in the background so the next batch can start collecting
+            task = asyncio.create_task(self.process_batch(batch))
+            self._batches.add(task)
+            task.add_done_callback(self._batches.discard)
+
+    async def _dispatch(self, request: NotificationRequest, future: asyncio.Future):
+        try:
+            result = await self.service.send_notification(request)
+        except Exception as e:
+            if not future.done():
+                future.set_exception(e)
+        else:
+            if not future.done():
+                future.set_result(result)
 ```python
 # senders/__init__.py
 # This file makes 'senders' a Python package.
 ```python
+# senders/transport.py
+# Shared HTTP plumbing for the senders: pooled keep-alive sessions and retrying POSTs
+
+import asyncio
+from typing import Optional, Union
+
+import aiohttp
+import orjson
+from notification_core import NotificationChannel
+
+# Maximum concurrent requests to each provider per worker process. Bursts beyond
+# this wait locally instead of tripping provider 429s. The semaphores are not
+# shared between processes, so the effective cap is these values times the number
+# of workers (2*CPU+1 under gunicorn_conf.py); size them with that in mind.
+CHANNEL_CONCURRENCY = {
+    NotificationChannel.WHATSAPP: 80,
+    NotificationChannel.TELEGRAM: 30,
+    NotificationChannel.VIBER: 50,
+}
+_LIMITS = {channel: asyncio.Semaphore(limit) for channel, limit in CHANNEL_CONCURRENCY.items()}
+
+def channel_limit(channel: NotificationChannel) -> asyncio.Semaphore:
+    """
+    Returns the semaphore bounding concurrent requests to a channel's provider
+    from this worker process. Shared by every sender for that channel in the process.
+    :param channel: The NotificationChannel enum member.
+    :return: The channel's asyncio.Semaphore.
+    """
+    return _LIMITS[channel]
+
+# Statuses worth retrying: only those meaning the provider did not process the
+# request (rate limited, or unavailable). 502 and 504 are not retried, since like
+# a timeout the provider may already be delivering the message.
+RETRY_STATUSES = frozenset({429, 503})
+
+# Longest provider-requested wait (Retry-After) honoured before giving up
+MAX_RETRY_AFTER = 30.0
+
+# Transport failures worth retrying, chosen with care because the provider POSTs
+# are not idempotent:
+# - ClientConnectorError (a ClientOSError): the connection was never established,
+#   so nothing reached the provider.
+# - ServerDisconnectedError and other ClientOSErrors (e.g. connection reset): almost
+#   always a pooled keep-alive connection the provider had already closed. A duplicate
+#   alert is possible but rare, and preferable to dropping the alert.
+# Timeouts are deliberately not retried: the provider may still be processing the
+# request, and the attempt has already used the session's whole time budget.
+RETRY_EXCEPTIONS = (aiohttp.ClientOSError, aiohttp.ServerDisconnectedError)
+
+# Error bodies are only logged, so read no more than this many bytes of them
+MAX_ERROR_BODY_BYTES = 512
+
+def _retry_after(response: aiohttp.ClientResponse, body: bytes) -> Optional[float]:
+    # Seconds the provider asked us to wait: the Retry-After header, or Telegram's
+    # {"parameters": {"retry_after": N}} in the body. The HTTP-date form of
+    # Retry-After is not supported and falls back to exponential backoff.
+    header = response.headers.get("Retry-After")
+    if header is not None:
+        try:
+            return float(header)
+        except ValueError:
+            pass
+    try:
+        return float(orjson.loads(body)["parameters"]["retry_after"])
+    except (ValueError, KeyError, TypeError):
+        return None
+
+def create_session(headers: Optional[dict] = None, pool_size: int = 50) -> aiohttp.ClientSession:
+    """
+    Creates an HTTP session with its own keep-alive connection pool, so TLS
+    handshakes are amortized across messages. Must be called on the running event loop.
+    :param headers: Headers sent implicitly with every request, in addition to the JSON Content-Type.
+    :param pool_size: Maximum number of open connections in the pool.
+    :return: The new aiohttp.ClientSession.
+    """
+    connector = aiohttp.TCPConnector(limit=pool_size, keepalive_timeout=30)
+    return aiohttp.ClientSession(
+        connector=connector,
+        headers={"Content-Type": "application/json", **(headers or {})},
+        timeout=aiohttp.ClientTimeout(total=10)
+    )
+
+async def post_json(session: aiohttp.ClientSession, url: str, payload: dict,
+                    retries: int = 3, backoff_factor: float = 0.2) -> tuple[int, Union[bytes, str]]:
+    """
+    POSTs a payload encoded with orjson, retrying RETRY_EXCEPTIONS and RETRY_STATUSES
+    with exponential backoff. A wait requested by the provider (Retry-After) is
+    honoured instead, unless it exceeds MAX_RETRY_AFTER, in which case the error is returned.
+    :param session: The session to send the request on.
+    :param url: The endpoint URL.
+    :param payload: The JSON-serializable request body.
+    :param retries: Number of retries after the first attempt.
+    :param backoff_factor: Base delay in seconds, doubled after each retry.
+    :return: The HTTP status and response body of the last attempt: the raw bytes on
+             success, or for error statuses the first MAX_ERROR_BODY_BYTES decoded as
+             UTF-8 text for logging.
+    """
+    data = orjson.dumps(payload)
+    for attempt in range(retries + 1):
+        delay = backoff_factor * (2 ** attempt)
+        try:
+            async with session.post(url, data=data) as response:
+                if response.status < 400:
+                    return response.status, await response.read()
+                body = await response.content.read(MAX_ERROR_BODY_BYTES)
+                if response.status in RETRY_STATUSES and attempt < retries:
+                    retry_after = _retry_after(response, body)
+                    if retry_after is not None:
+                        delay = retry_after
+                if response.status not in RETRY_STATUSES or attempt == retries or delay > MAX_RETRY_AFTER:
+                    return response.status, body.decode('utf-8', 'replace')
+        except RETRY_EXCEPTIONS:
+            if attempt == retries:
+                raise
+        await asyncio.sleep(delay)
+```python
 # senders/whatsapp_sender.py
 # Implementation for sending notifications via WhatsApp Business API
 
-import requests
-from notification_core import NotificationSender, NotificationChannel, NotificationRequest
+import asyncio
+import logging
+
+import aiohttp
+from notification_core import NotificationChannel, NotificationRequest
+from senders.transport import CHANNEL_CONCURRENCY, channel_limit, create_session, post_json
 from messages import get_localized_message # For multilingual support
 from datetime import date
 
-class WhatsAppSender(NotificationSender):
+log = logging.getLogger(__name__)
+
+class WhatsAppSender:
     """
     Sends notifications using the WhatsApp Business API.
     Requires a pre-approved message template for business-initiated messages.
@@ -258,21 +841,26 @@ class WhatsAppSender(NotificationSender):
         self.from_phone_number_id = config.WHATSAPP_FROM_PHONE_NUMBER_ID
         self.template_name = config.WHATSAPP_TEMPLATE_NAME
 
-    def send(self, request: NotificationRequest) -> bool:
+        # Static per-sender values, built once rather than on every send
+        # The actual API endpoint will be like: https://graph.facebook.com/v19.0/{phone-number-id}/messages
+        self._endpoint = f"{self.api_url}/{self.from_phone_number_id}/messages"
+        self._session = create_session(
+            {"Authorization": f"Bearer {self.access_token}"},
+            pool_size=CHANNEL_CONCURRENCY[NotificationChannel.WHATSAPP]
+        )
+        self._limit = channel_limit(NotificationChannel.WHATSAPP)
+
+    async def send(self, request: NotificationRequest) -> bool:
         if not request.recipient_phone_number:
-            print("WhatsApp recipient phone number is missing.")
+            log.warning("WhatsApp recipient phone number is missing.")
             return False
         if not self.access_token or not self.from_phone_number_id:
-            print("WhatsApp API access token or phone number ID is not configured.")
+            log.error("WhatsApp API access token or phone number ID is not configured.")
             return False
 
-        headers = {
-            "Authorization": f"Bearer {self.access_token}",
-            "Content-Type": "application/json"
-        }
-
-        # Format expiry_date for the message
-        expiry_date_formatted = request.expiry_date.strftime("%d-%m-%Y") if request.expiry_date else "N/A"
+        # Format expiry_date for the message as DD-MM-YYYY
+        expiry_date = request.expiry_date
+        expiry_date_formatted = f"{expiry_date.day:02d}-{expiry_date.month:02d}-{expiry_date.year}" if expiry_date else "N/A"
 
         # Prepare parameters for the WhatsApp template
         # This assumes a template like: "Your {{1}} will expire on {{2}}. Please take the following action: {{3}}."
@@ -300,30 +888,40 @@ class WhatsAppSender(NotificationSender):
         }
 
         try:
-            # The actual API endpoint will be like: https://graph.facebook.com/v19.0/{phone-number-id}/messages
-            api_endpoint = f"{self.api_url}/{self.from_phone_number_id}/messages"
-            response = requests.post(api_endpoint, json=payload, headers=headers)
-            response.raise_for_status()  # Raise an exception for HTTP errors (4xx or 5xx)
-            print(f"WhatsApp notification sent to {request.recipient_phone_number}. Response: {response.json()}")
-            return True
-        except requests.exceptions.RequestException as e:
-            print(f"Failed to send WhatsApp notification to {request.recipient_phone_number}: {e}")
-            print(f"Response content: {response.text if 'response' in locals() else 'No response'}")
+            async with self._limit:
+                status, body = await post_json(self._session, self._endpoint, payload)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            log.warning("Failed to send WhatsApp notification to %s: %r", request.recipient_phone_number, e)
+            return False
+
+        if status >= 400:
+            log.warning("Failed to send WhatsApp notification to %s: HTTP %s. Response content: %s", request.recipient_phone_number, status, body)
             return False
+        log.info("WhatsApp notification sent to %s. Response: %r", request.recipient_phone_number, body)
+        return True
 
     def get_channel_type(self) -> NotificationChannel:
         return NotificationChannel.WHATSAPP
 
+    async def close(self) -> None:
+        await self._session.close()
+
 ```python
 # senders/telegram_sender.py
 # Implementation for sending notifications via Telegram Bot API
 
-import requests
-from notification_core import NotificationSender, NotificationChannel, NotificationRequest
+import asyncio
+import logging
+
+import aiohttp
+from notification_core import NotificationChannel, NotificationRequest
+from senders.transport import CHANNEL_CONCURRENCY, channel_limit, create_session, post_json
 from messages import get_localized_message
 from datetime import date
 
-class TelegramSender(NotificationSender):
+log = logging.getLogger(__name__)
+
+class TelegramSender:
     """
     Sends notifications using the Telegram Bot API.
     """
@@ -331,24 +929,28 @@ class TelegramSender(NotificationSender):
         self.api_url = config.TELEGRAM_API_URL
         self.bot_token = config.TELEGRAM_BOT_TOKEN
 
-    def send(self, request: NotificationRequest) -> bool:
+        # Static per-sender values, built once rather than on every send
+        self._endpoint = f"{self.api_url}{self.bot_token}/sendMessage"
+        self._session = create_session(pool_size=CHANNEL_CONCURRENCY[NotificationChannel.TELEGRAM])
+        self._limit = channel_limit(NotificationChannel.TELEGRAM)
+
+    async def send(self, request: NotificationRequest) -> bool:
         if not request.telegram_chat_id:
-            print("Telegram chat ID is missing.")
+            log.warning("Telegram chat ID is missing.")
             return False
         if not self.bot_token:
-            print("Telegram Bot Token is not configured.")
+            log.error("Telegram Bot Token is not configured.")
             return False
 
-        # Format expiry_date for the message
-        expiry_date_formatted = request.expiry_date.strftime("%d-%m-%Y") if request.expiry_date else "N/A"
+        # Format expiry_date for the message as DD-MM-YYYY
+        expiry_date = request.expiry_date
+        expiry_date_formatted = f"{expiry_date.day:02d}-{expiry_date.month:02d}-{expiry_date.year}" if expiry_date else "N/A"
 
         # Get localized message from messages.py
         message_text = get_localized_message(
             "telegram.expiry.message",
             request.locale,
-            request.expiry_type,
-            expiry_date_formatted,
-            request.action_steps
+            (request.expiry_type, expiry_date_formatted, request.action_steps)
         )
 
         payload = {
@@ -357,29 +959,40 @@ class TelegramSender(NotificationSender):
         }
 
         try:
-            api_endpoint = f"{self.api_url}{self.bot_token}/sendMessage"
-            response = requests.post(api_endpoint, json=payload)
-            response.raise_for_status()
-            print(f"Telegram notification sent to chat ID {request.telegram_chat_id}. Response: {response.json()}")
-            return True
-        except requests.exceptions.RequestException as e:
-            print(f"Failed to send Telegram notification to {request.telegram_chat_id}: {e}")
-            print(f"Response content: {response.text if 'response' in locals() else 'No response'}")
+            async with self._limit:
+                status, body = await post_json(self._session, self._endpoint, payload)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            log.warning("Failed to send Telegram notification to %s: %r", request.telegram_chat_id, e)
             return False
 
+        if status >= 400:
+            log.warning("Failed to send Telegram notification to %s: HTTP %s. Response content: %s", request.telegram_chat_id, status, body)
+            return False
+        log.info("Telegram notification sent to chat ID %s. Response: %r", request.telegram_chat_id, body)
+        return True
+
     def get_channel_type(self) -> NotificationChannel:
         return NotificationChannel.TELEGRAM
 
+    async def close(self) -> None:
+        await self._session.close()
+
 ```python
 # senders/viber_sender.py
 # Implementation for sending notifications via Viber REST API
 
-import requests
-from notification_core import NotificationSender, NotificationChannel, NotificationRequest
+import asyncio
+import logging
+
+import aiohttp
+from notification_core import NotificationChannel, NotificationRequest
+from senders.transport import CHANNEL_CONCURRENCY, channel_limit, create_session, post_json
 from messages import get_localized_message
 from datetime import date
 
-class ViberSender(NotificationSender):
+log = logging.getLogger(__name__)
+
+class ViberSender:
     """
     Sends notifications using the Viber REST API.
     """
@@ -389,29 +1002,31 @@ class ViberSender(NotificationSender):
         self.sender_name = config.VIBER_SENDER_NAME
         self.sender_avatar = config.VIBER_SENDER_AVATAR
 
-    def send(self, request: NotificationRequest) -> bool:
+        # Static per-sender values, built once rather than on every send
+        self._endpoint = f"{self.api_url}send_message"
+        self._session = create_session(
+            {"X-Viber-Auth-Token": self.auth_token or ""},
+            pool_size=CHANNEL_CONCURRENCY[NotificationChannel.VIBER]
+        )
+        self._limit = channel_limit(NotificationChannel.VIBER)
+
+    async def send(self, request: NotificationRequest) -> bool:
         if not request.viber_user_id:
-            print("Viber user ID is missing.")
+            log.warning("Viber user ID is missing.")
             return False
         if not self.auth_token:
-            print("Viber Auth Token is not configured.")
+            log.error("Viber Auth Token is not configured.")
             return False
 
-        headers = {
-            "X-Viber-Auth-Token": self.auth_token,
-            "Content-Type": "application/json"
-        }
-
-        # Format expiry_date for the message
-        expiry_date_formatted = request.expiry_date.strftime("%d-%m-%Y") if request.expiry_date else "N/A"
+        # Format expiry_date for the message as DD-MM-YYYY
+        expiry_date = request.expiry_date
+        expiry_date_formatted = f"{expiry_date.day:02d}-{expiry_date.month:02d}-{expiry_date.year}" if expiry_date else "N/A"
 
         # Get localized message from messages.py
         message_text = get_localized_message(
             "viber.expiry.message",
             request.locale,
-            request.expiry_type,
-            expiry_date_formatted,
-            request.action_steps
+            (request.expiry_type, expiry_date_formatted, request.action_steps)
         )
 
         payload = {
@@ -425,53 +1040,100 @@ class ViberSender(NotificationSender):
         }
 
         try:
-            api_endpoint = f"{self.api_url}send_message"
-            response = requests.post(api_endpoint, json=payload, headers=headers)
-            response.raise_for_status()
-            print(f"Viber notification sent to user ID {request.viber_user_id}. Response: {response.json()}")
-            return True
-        except requests.exceptions.RequestException as e:
-            print(f"Failed to send Viber notification to {request.viber_user_id}: {e}")
-            print(f"Response content: {response.text if 'response' in locals() else 'No response'}")
+            async with self._limit:
+                status, body = await post_json(self._session, self._endpoint, payload)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            log.warning("Failed to send Viber notification to %s: %r", request.viber_user_id, e)
             return False
 
+        if status >= 400:
+            log.warning("Failed to send Viber notification to %s: HTTP %s. Response content: %s", request.viber_user_id, status, body)
+            return False
+        log.info("Viber notification sent to user ID %s. Response: %r", request.viber_user_id, body)
+        return True
+
     def get_channel_type(self) -> NotificationChannel:
         return NotificationChannel.VIBER
 
+    async def close(self) -> None:
+        await self._session.close()
+
 ```python
 # messages/__init__.py
 # This file makes 'messages' a Python package.
 
+import logging
+from functools import lru_cache
+from typing import Callable
+
 from . import en # Import default language messages
 # from . import fr # Import other languages as needed
 
+log = logging.getLogger(__name__)
+
 # Dictionary to hold message bundles by locale
 _messages = {
     "en": en.MESSAGES,
     # "fr": fr.MESSAGES, # Uncomment if you add fr.py
 }
 
-def get_localized_message(key: str, locale: str, *args) -> str:
+def _compile(template: str) -> Callable[..., str]:
+    """
+    Compiles a template with positional "{}" fields into a function that joins
+    its pre-split literal chunks with the arguments, so rendering skips the
+    str.format parse. Templates using any other field syntax fall back to str.format.
+    :param template: The message template.
+    :return: A function taking the format arguments and returning the message.
+    """
+    literals = template.split("{}")
+    if any("{" in literal or "}" in literal for literal in literals):
+        return template.format
+
+    # e.g. "A {} B {}" -> lambda a0, a1, *_: "".join((_l0, str(a0), _l1, str(a1), _l2))
+    params = "".join(f"a{i}, " for i in range(len(literals) - 1))
+    parts = ["_l0"] + [f"str(a{i}), _l{i + 1}" for i in range(len(literals) - 1)]
+    namespace = {f"_l{i}": literal for i, literal in enumerate(literals)}
+    return eval(f"lambda {params}*_: ''.join(({', '.join(parts)},))", namespace)
+
+# Compiled message bundles, built once at import
+_compiled_messages = {
+    locale: {key: _compile(template) for key, template in bundle.items()}
+    for locale, bundle in _messages.items()
+}
+
+@lru_cache(maxsize=4096)
+def get_localized_message(key: str, locale: str, args: tuple = ()) -> str:
     """
     Retrieves a localized message string and formats it.
+    Results are memoized, since the same alert is usually sent to many recipients.
     :param key: The key of the message (e.g., "whatsapp.expiry.message").
     :param locale: The desired locale (e.g., "en", "fr").
-    :param args: Arguments to format the message string.
+    :param args: Tuple of arguments to format the message string.
     :return: The formatted localized message.
     """
     # Fallback to English if locale not found
-    message_bundle = _messages.get(locale, _messages["en"])
-    message_template = message_bundle.get(key, f"Missing message for key: {key}")
+    if locale not in _messages:
+        locale = "en"
+    render = _compiled_messages[locale].get(key)
+    if render is None:
+        return f"Missing message for key: {key}"
+    message_template = _messages[locale][key]
 
     try:
-        return message_template.format(*args)
-    except IndexError:
-        print(f"Warning: Not enough arguments provided for message key '{key}' in locale '{locale}'. Template: '{message_template}'")
+        return render(*args)
+    except (IndexError, TypeError):
+        log.warning("Not enough arguments provided for message key '%s' in locale '%s'. Template: '%s'", key, locale, message_template)
         return message_template # Return template without formatting if args don't match
     except Exception as e:
-        print(f"Error formatting message for key '{key}' in locale '{locale}': {e}")
+        log.error("Error formatting message for key '%s' in locale '%s': %s", key, locale, e)
         return message_template # Fallback
 
+def clear_message_cache() -> None:
+    """
+    Clears the memoized messages, e.g. after a message bundle changes or between tests.
+    """
+    get_localized_message.cache_clear()
+
 ```python
 # messages/en.py
 # English message templates
@@ -492,6 +1154,64 @@ MESSAGES = {
     "viber.expiry.message": "Important : {} expire le {}. Prochaines étapes : {}.",
     # Add other messages as needed
 }
+```python
+# tests/test_notification_batcher.py
+# Tests for NotificationBatcher dispatch. Run with: python -m unittest discover tests
+
+import asyncio
+import time
+import unittest
+
+from notification_batcher import NotificationBatcher
+from notification_core import NotificationChannel, NotificationRequest, NotificationService
+
+class FakeSender:
+    """
+    Stand-in for a channel sender: holds a per-channel slot around each send,
+    like the real senders do with senders.transport.channel_limit().
+    """
+    def __init__(self, channel: NotificationChannel, limit: int, delay: float):
+        self.channel = channel
+        self.delay = delay
+        self._limit = asyncio.Semaphore(limit)
+
+    async def send(self, request: NotificationRequest) -> bool:
+        async with self._limit:
+            await asyncio.sleep(self.delay)
+        return True
+
+    def get_channel_type(self) -> NotificationChannel:
+        return self.channel
+
+    async def close(self) -> None:
+        pass
+
+class NotificationBatcherTest(unittest.IsolatedAsyncioTestCase):
+    async def test_idle_channel_is_not_delayed_by_saturated_channel(self):
+        service = NotificationService({
+            NotificationChannel.TELEGRAM: FakeSender(NotificationChannel.TELEGRAM, limit=5, delay=0.1),
+            NotificationChannel.VIBER: FakeSender(NotificationChannel.VIBER, limit=5, delay=0),
+        })
+        batcher = NotificationBatcher(service, max_queue_time=0.01)
+
+        # 100 Telegram alerts at 5 concurrent x 0.1 s keep that channel busy for 2 s
+        backlog = [
+            asyncio.create_task(batcher.process(NotificationRequest(
+                telegram_chat_id=str(chat_id), channels=[NotificationChannel.TELEGRAM])))
+            for chat_id in range(100)
+        ]
+        await asyncio.sleep(0.05)
+
+        started = time.monotonic()
+        sent = await batcher.process(NotificationRequest(viber_user_id="viber-user", channels=[NotificationChannel.VIBER]))
+
+        self.assertTrue(sent)
+        self.assertLess(time.monotonic() - started, 0.5)
+        self.assertFalse(all(task.done() for task in backlog))
+        self.assertTrue(all(await asyncio.gather(*backlog)))
+
+if __name__ == '__main__':
+    unittest.main()
 ```text
 # .env
 # Environment variables for API keys and other sensitive configurations